@@ -1,11 +1,22 @@
 import sqlite3
+import yaml
+from pathlib import Path
 
-db_path = "/Users/ashishmathew/Documents/Development/AlgoTrader/database/algo_data.db"
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-cursor.execute("PRAGMA table_info(nifty_50_historic_20240419)")
-columns = cursor.fetchall()
-print("Columns in nifty_50_historic_20240419:")
-for col in columns:
-    print(f"Name: {col[1]}, Type: {col[2]}")
-conn.close()
\ No newline at end of file
+def inspect_table(db_path: str, table_name: str):
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        # Bind the table name as a parameter rather than formatting it into the SQL
+        cursor.execute("SELECT * FROM pragma_table_info(?)", (table_name,))
+        columns = cursor.fetchall()
+    finally:
+        conn.close()
+    print(f"Columns in {table_name}:")
+    for col in columns:
+        print(f"Name: {col[1]}, Type: {col[2]}")
+
+if __name__ == "__main__":
+    # Load db_path from config.yaml
+    with open(Path(__file__).parent / 'config' / 'config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    inspect_table(config['database']['db_path'], 'nifty_50_historic_20240419')
\ No newline at end of file
@@ -25,13 +25,14 @@ class RSIStrategy(BaseStrategy):
         Generate trading signals based on RSI.
         Buy (1) when RSI < oversold, Sell (-1) when RSI > overbought, Hold (0) otherwise.
         """
-        signals = pd.DataFrame(index=self.data.index)
-        signals['Close'] = self.data['Close']
-        signals['RSI'] = self.calculate_rsi(self.data['Close'])
-        signals['Signal'] = 0
+        rsi = self.calculate_rsi(self.data['Close']).to_numpy()
 
-        # Generate signals
-        signals.loc[signals['RSI'] < self.oversold, 'Signal'] = 1   # Buy
-        signals.loc[signals['RSI'] > self.overbought, 'Signal'] = -1  # Sell
+        # Generate signals (Sell takes precedence if both thresholds are crossed)
+        signal = np.where(rsi > self.overbought, -1,   # Sell
+                          np.where(rsi < self.oversold, 1, 0))  # Buy / Hold
 
-        return signals
\ No newline at end of file
+        return pd.DataFrame({
+            'Close': self.data['Close'],
+            'RSI': rsi,
+            'Signal': signal
+        }, index=self.data.index)
\ No newline at end of file